@@ -2,6 +2,8 @@ import pygame
 import sys
 import math
 import copy
+import json
+import os
 
 # Initialize Pygame
 pygame.init()
@@ -33,6 +35,23 @@ BLACK_PIECE = 2
 RED_KING = 3
 BLACK_KING = 4
 
+# Evaluation weights (overridden by the file written by tune_weights.py)
+EVAL_FEATURES = ["piece", "king", "back_row", "center"]
+DEFAULT_EVAL_WEIGHTS = {"piece": 1.0, "king": 0.5, "back_row": 0.0, "center": 0.0}
+EVAL_WEIGHTS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "eval_weights.json")
+
+def load_eval_weights(path=EVAL_WEIGHTS_FILE):
+    weights = dict(DEFAULT_EVAL_WEIGHTS)
+    try:
+        with open(path) as f:
+            loaded = json.load(f)
+    except (OSError, ValueError):
+        return weights
+    for name in EVAL_FEATURES:
+        if name in loaded:
+            weights[name] = float(loaded[name])
+    return weights
+
 class Piece:
     def __init__(self, color, is_king=False):
         self.color = color
@@ -75,10 +94,10 @@ class Board:
         self.board[end_row][end_col] = piece
         
         # Check for king promotion
-        if piece.color == RED_PIECE and end_row == 0:
+        if piece.color == RED_PIECE and end_row == 0 and not piece.is_king:
             piece.make_king()
             self.red_kings += 1
-        elif piece.color == BLACK_PIECE and end_row == 7:
+        elif piece.color == BLACK_PIECE and end_row == 7 and not piece.is_king:
             piece.make_king()
             self.black_kings += 1
     
@@ -187,11 +206,34 @@ class Board:
         
         return new_board
     
-    def evaluate(self):
+    def get_features(self):
+        # Red-minus-black feature counts, in EVAL_FEATURES order
+        piece = king = back_row = center = 0
+        for row in range(BOARD_SIZE):
+            for col in range(BOARD_SIZE):
+                p = self.board[row][col]
+                if p == EMPTY:
+                    continue
+                sign = 1 if p.color == RED_PIECE else -1
+                piece += sign
+                if p.is_king:
+                    king += sign
+                elif row == (7 if p.color == RED_PIECE else 0):
+                    back_row += sign
+                if 2 <= row <= 5 and 2 <= col <= 5:
+                    center += sign
+        return [piece, king, back_row, center]
+    
+    def evaluate(self, weights=DEFAULT_EVAL_WEIGHTS):
         # Evaluation function for AI
-        red_score = self.red_pieces + self.red_kings * 0.5
-        black_score = self.black_pieces + self.black_kings * 0.5
-        return red_score - black_score
+        score = (weights["piece"] * (self.red_pieces - self.black_pieces)
+                 + weights["king"] * (self.red_kings - self.black_kings))
+        
+        # Positional features need a board scan, so skip it when they are unused
+        if weights["back_row"] or weights["center"]:
+            _, _, back_row, center = self.get_features()
+            score += weights["back_row"] * back_row + weights["center"] * center
+        return score
     
     def is_game_over(self):
         if self.red_pieces == 0 or self.black_pieces == 0:
@@ -228,6 +270,7 @@ class AI:
         self.difficulty = difficulty  # 1=Easy, 2=Medium, 3=Hard
         self.difficulty_names = ["Easy", "Medium", "Hard"]
         self.max_depth = self.get_depth_for_difficulty(difficulty)
+        self.weights = load_eval_weights()
     
     def get_depth_for_difficulty(self, difficulty):
         depth_map = {1: 2, 2: 4, 3: 6}
@@ -239,7 +282,7 @@ class AI:
     
     def minimax(self, board, depth, maximizing_player, alpha=float('-inf'), beta=float('inf')):
         if depth == 0 or board.is_game_over():
-            return board.evaluate(), None
+            return board.evaluate(self.weights), None
         
         if maximizing_player:
             max_eval = float('-inf')
@@ -0,0 +1,227 @@
+"""Offline tuning of the Board.evaluate weights.
+
+Generates labeled positions from self-play across a process pool, then fits
+the weights with vectorized logistic regression. Progress is checkpointed, so
+an interrupted run picks up where it stopped. The result is written to
+eval_weights.json, which the AI loads at startup.
+
+    python tune_weights.py --positions 1000000
+"""
+import argparse
+import json
+import os
+import random
+import sys
+from multiprocessing import Pool
+
+# The game module initializes pygame on import; keep it headless
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("SDL_NO_SIGNAL_HANDLERS", "1")
+
+import numpy as np
+
+from Checker_Informal import (
+    Board, RED_PIECE, BLACK_PIECE, EVAL_FEATURES, EVAL_WEIGHTS_FILE,
+)
+
+# Self-play settings
+CHUNK_SIZE = 50000      # positions per checkpointed chunk
+MAX_PLIES = 200         # games longer than this are scored as draws
+SKIP_PLIES = 4          # opening positions carry almost no signal
+CAPTURE_BIAS = 0.9      # chance to prefer a capture when one is available
+
+# Fitting settings
+MAX_ITERATIONS = 50
+TOLERANCE = 1e-8
+L2 = 1e-6
+
+
+def play_game(rng):
+    board = Board()
+    player = RED_PIECE
+    features = []
+    result = 0.5
+
+    for ply in range(MAX_PLIES):
+        moves = []
+        for row, col in board.get_all_pieces(player):
+            for end_row, end_col in board.get_valid_moves(row, col):
+                moves.append((row, col, end_row, end_col))
+
+        # A side with no pieces or no moves has lost
+        if not moves:
+            result = 0.0 if player == RED_PIECE else 1.0
+            break
+
+        jumps = [m for m in moves if abs(m[2] - m[0]) == 2]
+        if jumps and rng.random() < CAPTURE_BIAS:
+            move = rng.choice(jumps)
+        else:
+            move = rng.choice(moves)
+        board.make_move(*move)
+
+        if ply >= SKIP_PLIES:
+            features.append(board.get_features())
+        player = BLACK_PIECE if player == RED_PIECE else RED_PIECE
+
+    return features, result
+
+
+def generate_chunk(args):
+    index, seed = args
+    rng = random.Random(seed)
+    features = []
+    labels = []
+
+    while len(features) < CHUNK_SIZE:
+        game_features, result = play_game(rng)
+        features.extend(game_features)
+        labels.extend([result] * len(game_features))
+
+    features = np.array(features[:CHUNK_SIZE], dtype=np.int8)
+    labels = np.array(labels[:CHUNK_SIZE], dtype=np.float32)
+    return index, features, labels
+
+
+def chunk_path(data_dir, index):
+    return os.path.join(data_dir, f"chunk_{index:04d}.npz")
+
+
+def check_manifest(data_dir, seed):
+    # Chunk i is always played with seed + i, so chunks can only be reused
+    # when the base seed and chunk size match the run that wrote them
+    path = os.path.join(data_dir, "manifest.json")
+    manifest = {"seed": seed, "chunk_size": CHUNK_SIZE}
+    try:
+        with open(path) as f:
+            existing = json.load(f)
+    except (OSError, ValueError):
+        existing = None
+
+    if existing is not None and existing != manifest:
+        sys.exit(f"{data_dir} holds positions from seed {existing.get('seed')} with chunk size "
+                 f"{existing.get('chunk_size')}; use another --data-dir or delete it")
+    with open(path, "w") as f:
+        json.dump(manifest, f)
+
+
+def generate_positions(data_dir, positions, workers, seed):
+    os.makedirs(data_dir, exist_ok=True)
+    check_manifest(data_dir, seed)
+    num_chunks = -(-positions // CHUNK_SIZE)
+    missing = [(i, seed + i) for i in range(num_chunks)
+               if not os.path.exists(chunk_path(data_dir, i))]
+
+    print(f"Self-play: {num_chunks - len(missing)}/{num_chunks} chunks already done")
+    if missing:
+        # Close and join rather than letting the context manager terminate the
+        # workers; SIGTERM is not a reliable way to stop them once pygame is loaded
+        pool = Pool(workers)
+        for index, features, labels in pool.imap_unordered(generate_chunk, missing):
+            # Write to a temp file first so a killed run never leaves a partial chunk
+            path = chunk_path(data_dir, index)
+            tmp_path = path + ".tmp.npz"
+            np.savez(tmp_path, features=features, labels=labels)
+            os.replace(tmp_path, path)
+            print(f"  wrote {path}")
+        pool.close()
+        pool.join()
+
+    return num_chunks
+
+
+def load_positions(data_dir, num_chunks):
+    features = []
+    labels = []
+    for i in range(num_chunks):
+        with np.load(chunk_path(data_dir, i)) as data:
+            features.append(data["features"])
+            labels.append(data["labels"])
+    return (np.concatenate(features).astype(np.float64),
+            np.concatenate(labels).astype(np.float64))
+
+
+def sigmoid(z):
+    return 1.0 / (1.0 + np.exp(-z))
+
+
+def load_checkpoint(path, data_id):
+    try:
+        with open(path) as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        state = None
+
+    # A checkpoint fitted on a different data set is discarded
+    if state is None or state.get("data") != data_id:
+        return 0, np.zeros(len(EVAL_FEATURES))
+    print(f"Resuming fit from iteration {state['iteration']}")
+    return state["iteration"], np.array(state["coefficients"], dtype=np.float64)
+
+
+def save_checkpoint(path, data_id, iteration, coefficients):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"data": data_id, "iteration": iteration,
+                   "coefficients": coefficients.tolist()}, f)
+    os.replace(tmp_path, path)
+
+
+def fit_weights(X, y, checkpoint_path, data_id):
+    # Logistic regression P(red wins) = sigmoid(X @ w) with the game results
+    # (1 / 0.5 / 0) as soft labels, solved by Newton's method.
+    iteration, w = load_checkpoint(checkpoint_path, data_id)
+    n = len(y)
+    eye = np.eye(X.shape[1])
+
+    while iteration < MAX_ITERATIONS:
+        p = sigmoid(X @ w)
+        gradient = X.T @ (p - y) / n + L2 * w
+        hessian = X.T @ (X * (p * (1.0 - p))[:, None]) / n + L2 * eye
+        step = np.linalg.solve(hessian, gradient)
+        w = w - step
+        iteration += 1
+        save_checkpoint(checkpoint_path, data_id, iteration, w)
+
+        p = np.clip(sigmoid(X @ w), 1e-12, 1.0 - 1e-12)
+        loss = -np.mean(y * np.log(p) + (1.0 - y) * np.log(1.0 - p))
+        print(f"  iteration {iteration}: loss {loss:.6f}")
+        if np.max(np.abs(step)) < TOLERANCE:
+            break
+
+    return w
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tune the checkers evaluation weights from self-play")
+    parser.add_argument("--positions", type=int, default=1000000, help="number of labeled positions")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="self-play processes")
+    parser.add_argument("--seed", type=int, default=0, help="base random seed for self-play")
+    parser.add_argument("--data-dir", default="tuning_data", help="where chunks and checkpoints are kept")
+    parser.add_argument("--output", default=EVAL_WEIGHTS_FILE, help="weights file the AI loads")
+    args = parser.parse_args()
+
+    num_chunks = generate_positions(args.data_dir, args.positions, args.workers, args.seed)
+    X, y = load_positions(args.data_dir, num_chunks)
+
+    print(f"Fitting on {len(y)} positions")
+    checkpoint_path = os.path.join(args.data_dir, "fit_checkpoint.json")
+    data_id = {"seed": args.seed, "num_chunks": num_chunks}
+    coefficients = fit_weights(X, y, checkpoint_path, data_id)
+
+    # Express the weights in units of one piece, like the hand-set defaults
+    piece_index = EVAL_FEATURES.index("piece")
+    if coefficients[piece_index] <= 0:
+        sys.exit("Fit failed: material weight is not positive, generate more positions")
+    scale = coefficients[piece_index]
+    weights = {name: round(float(c / scale), 4) for name, c in zip(EVAL_FEATURES, coefficients)}
+
+    with open(args.output, "w") as f:
+        json.dump(weights, f, indent=4)
+    os.remove(checkpoint_path)
+    print(f"Wrote {args.output}: {weights}")
+
+
+if __name__ == "__main__":
+    main()